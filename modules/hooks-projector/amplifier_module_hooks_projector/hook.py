@@ -12,21 +12,309 @@ session:end      - Captures a best-effort outcome summary to the project log.
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import configparser
+import functools
 import json
 import logging
+import os
+import re
 import subprocess
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from amplifier_core.hooks import HookResult
 
-import asyncio
+try:  # optional fast JSON codec
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize *obj* as compact UTF-8 JSON."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits or non-str keys; the stdlib copes
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
 
 logger = logging.getLogger(__name__)
 
+# Parsed YAML keyed by path -> (st_mtime_ns, st_size, data).  Lives at module
+# level so repeated mounts in one process skip re-parsing unchanged files.
+_YAML_CACHE: dict[str, tuple[int, int, dict]] = {}
+
+# Initial tail window when reading recent outcomes; doubled until enough
+# complete lines are found or the start of the file is reached.
+_OUTCOME_TAIL_BYTES = 64 * 1024
+
+# Wrapped injection payloads shared across hook instances in the same process,
+# keyed by every setting that shapes the output (strategies_path,
+# projects_path, working_dir, max_recent_outcomes) -> (built_at, root dir
+# mtimes, detected project dir, its file stamps, payload).  Entries expire
+# after _INJECTION_TTL seconds, when either root directory's mtime changes, or
+# when a state file of the detected project changes.
+_INJECTION_CACHE: dict[
+    tuple[str, str, str, int],
+    tuple[float, tuple[int, int], Path | None, tuple, str],
+] = {}
+_INJECTION_TTL = 60.0
+
+# Per-project files whose changes invalidate a cached injection.  The tool
+# rewrites or appends to these in place inside projects/<slug>/, which leaves
+# the projects root's mtime untouched.
+_PROJECT_STATE_FILES = ("project.yaml", "tasks.yaml", "outcomes.jsonl")
+
+# ``org/repo`` of a GitHub remote, used when auto-registering projects.
+_GITHUB_REPO_RE = re.compile(r"github\.com[:/](.+?)(?:\.git)?$")
+
+# Top-level ``active:`` line of a strategy file and the YAML tokens that
+# PyYAML's safe loader reads as false/null.
+_ACTIVE_LINE_RE = re.compile(
+    rb"^active:(?:[ \t]+([^ \t\r\n]+))?(?:[ \t]+#.*)?[ \t]*\r?$", re.MULTILINE
+)
+_FALSY_TOKENS = frozenset(
+    [b"false", b"False", b"FALSE", b"no", b"No", b"NO", b"off", b"Off", b"OFF"]
+    + [b"null", b"Null", b"NULL", b"~", b"0"]
+)
+# Markers of YAML structure the probe doesn't try to understand.
+_COMPLEX_YAML_MARKERS = (b"&", b"*", b"%YAML", b"---", b"{")
+
+# When at least this many YAML files need (re)reading they go to a thread pool,
+# provided it has more than one worker.
+_PARALLEL_READ_MIN = 8
+_READ_POOL_WORKERS = min(8, os.cpu_count() or 1)
+_READ_POOL: ThreadPoolExecutor | None = None
+
+# Repo index per projects root -> (stamp, by_repo, by_name, matches).  The
+# maps point at positions in the _load_all_projects list; *matches* memoizes
+# (remote_url, working_dir) -> position.  *stamp* records each project.yaml's
+# cache state, so any edit, addition or removal rebuilds the entry.
+_REPO_INDEX: dict[
+    str,
+    tuple[tuple, dict[str, int], dict[str, int], dict[tuple[str | None, str], int | None]],
+] = {}
+
+# origin URL per repository path -> (git config path, st_mtime_ns, url).
+_REMOTE_CACHE: dict[str, tuple[Path, int, str | None]] = {}
+
+# O_APPEND descriptors for outcomes.jsonl files, keyed by path.  Capped at
+# _MAX_OPEN_OUTCOME_LOGS (least recently used closed first) and guarded by
+# _OUTCOME_FDS_LOCK.
+_OUTCOME_FDS: OrderedDict[str, int] = OrderedDict()
+_OUTCOME_FDS_LOCK = threading.Lock()
+_MAX_OPEN_OUTCOME_LOGS = 32
+
+
+def _close_fd(fd: int) -> None:
+    """Close *fd*, ignoring errors."""
+    try:
+        os.close(fd)
+    except OSError:
+        pass
+
+
+def _close_outcome_fds() -> None:
+    """Close every cached outcome descriptor (registered with atexit)."""
+    with _OUTCOME_FDS_LOCK:
+        while _OUTCOME_FDS:
+            _, fd = _OUTCOME_FDS.popitem()
+            _close_fd(fd)
+
+
+atexit.register(_close_outcome_fds)
+
+
+def _append_line(path: Path, line: bytes) -> None:
+    """Append *line* to *path* with a single ``write`` on a cached descriptor.
+
+    ``O_APPEND`` makes each write land atomically at end-of-file, so
+    concurrent sessions can share the log.  A descriptor whose file has
+    since been unlinked is reopened.
+    """
+    key = str(path)
+    with _OUTCOME_FDS_LOCK:
+        fd = _OUTCOME_FDS.get(key)
+        if fd is not None and os.fstat(fd).st_nlink == 0:
+            del _OUTCOME_FDS[key]
+            _close_fd(fd)
+            fd = None
+        if fd is None:
+            fd = os.open(key, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            _OUTCOME_FDS[key] = fd
+            if len(_OUTCOME_FDS) > _MAX_OPEN_OUTCOME_LOGS:
+                _, evicted = _OUTCOME_FDS.popitem(last=False)
+                _close_fd(evicted)
+        else:
+            _OUTCOME_FDS.move_to_end(key)
+        os.write(fd, line)
+
+
+# ---------------------------------------------------------------------------
+# Lazy YAML import
+# ---------------------------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=1)
+def _get_yaml_loader() -> tuple[Any, Any]:
+    """Import PyYAML on first use and return ``(yaml, Loader)``.
+
+    Sessions without strategy or project directories never pay for the
+    import.  Prefers the libyaml-backed ``CSafeLoader`` (same semantics as
+    ``safe_load``).
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:  # pragma: no cover - pure-Python fallback
+        from yaml import SafeLoader as loader
+    return yaml, loader
+
+
+def _cached_yaml(path: str) -> dict | None:
+    """Return a copy of *path*'s cached YAML if the file is unchanged, else None."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    hit = _YAML_CACHE.get(path)
+    if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return dict(hit[2])
+    return None
+
+
+def _read_pool() -> ThreadPoolExecutor:
+    """Return the shared YAML read pool, creating it on first use."""
+    global _READ_POOL
+    if _READ_POOL is None:
+        _READ_POOL = ThreadPoolExecutor(
+            max_workers=_READ_POOL_WORKERS,
+            thread_name_prefix="hooks-projector-read",
+        )
+    return _READ_POOL
+
+
+# ---------------------------------------------------------------------------
+# Strategy probe
+# ---------------------------------------------------------------------------
+
+
+def _quick_strategy_probe(raw: bytes) -> bool | None:
+    """Read a strategy's top-level ``active`` flag without a full YAML parse.
+
+    Returns True/False for a single plain ``active:`` line, or None when
+    the file uses structure the probe doesn't handle (the caller then
+    parses normally).
+    """
+    if any(marker in raw for marker in _COMPLEX_YAML_MARKERS):
+        return None
+    matches = list(_ACTIVE_LINE_RE.finditer(raw))
+    if len(matches) != 1:
+        return None
+    match = matches[0]
+    # An indented line after it continues the plain scalar ("false and more").
+    if raw[match.end() :].lstrip(b"\r\n")[:1] in (b" ", b"\t"):
+        return None
+    token = match.group(1)
+    if token in _FALSY_TOKENS:
+        return False
+    if token in (b"true", b"True", b"TRUE", b"yes", b"Yes", b"YES", b"on", b"On", b"ON"):
+        return True
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Context rendering
+# ---------------------------------------------------------------------------
+
+
+def _render_task(task: dict) -> str:
+    """Render one task as a markdown bullet line."""
+    title = task.get("title", task.get("name", "(untitled)"))
+    status = task.get("status", "")
+    return f"- {title} [{status}]\n" if status else f"- {title}\n"
+
+
+# ---------------------------------------------------------------------------
+# Git remote lookup
+# ---------------------------------------------------------------------------
+
+
+def _find_git_config(start: Path) -> Path | None:
+    """Locate the config file of the git repository containing *start*."""
+    for candidate in (start, *start.parents):
+        dotgit = candidate / ".git"
+        if dotgit.is_dir():
+            return dotgit / "config"
+        if dotgit.is_file():
+            # Worktrees and submodules: ``.git`` is a file with ``gitdir: <path>``
+            text = dotgit.read_text(encoding="utf-8").strip()
+            if not text.startswith("gitdir:"):
+                return None
+            gitdir = candidate / text[len("gitdir:") :].strip()
+            commondir = gitdir / "commondir"
+            if commondir.is_file():
+                gitdir = gitdir / commondir.read_text(encoding="utf-8").strip()
+            return gitdir / "config"
+    return None
+
+
+def _git_remote_url_subprocess(repo: Path) -> str | None:
+    """Ask ``git`` for the origin URL (slow path)."""
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(repo), "remote", "get-url", "origin"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except Exception:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def _git_remote_url(repo: Path) -> str | None:
+    """Return the ``origin`` remote URL of the repository containing *repo*.
+
+    Reads the git config file directly, cached by its mtime, and only falls
+    back to running ``git`` when the config can't be located or parsed.
+    """
+    key = str(repo)
+    try:
+        hit = _REMOTE_CACHE.get(key)
+        if hit is not None and hit[0].stat().st_mtime_ns == hit[1]:
+            return hit[2]
+
+        config_path = _find_git_config(repo)
+        if config_path is None:
+            return None
+        mtime = config_path.stat().st_mtime_ns
+        parser = configparser.ConfigParser(strict=False, interpolation=None)
+        parser.read(config_path, encoding="utf-8")
+        url = parser.get('remote "origin"', "url", fallback=None)
+    except (OSError, UnicodeDecodeError, configparser.Error):
+        logger.debug("Failed to parse git config under %s", repo, exc_info=True)
+        return _git_remote_url_subprocess(repo)
+
+    if url is not None:
+        url = url.strip().strip('"') or None
+    _REMOTE_CACHE[key] = (config_path, mtime, url)
+    return url
+
+
 # ---------------------------------------------------------------------------
 # Public mount point - called by the Amplifier coordinator
 # ---------------------------------------------------------------------------
@@ -63,6 +351,20 @@ async def mount(coordinator: Any, config: dict) -> None:
 class ProjectorHook:
     """Injects project context on provider:request, captures outcomes on end."""
 
+    # Fixed attribute set: keeps instances small and attribute access off the
+    # instance dict on the per-request path.
+    __slots__ = (
+        "_coordinator",
+        "strategies_path",
+        "projects_path",
+        "_strategies_root",
+        "_projects_root",
+        "session_filter",
+        "max_recent_outcomes",
+        "_working_dir",
+        "_cached_injection",
+    )
+
     def __init__(self, config: dict, coordinator: Any = None) -> None:
         self._coordinator = coordinator
         self.strategies_path: Path = Path(
@@ -71,25 +373,26 @@ class ProjectorHook:
         self.projects_path: Path = Path(
             config.get("projects_path", "~/.amplifier/projector/projects")
         ).expanduser()
+        # Canonicalized once; _is_safe_path compares children against these.
+        self._strategies_root: str = os.path.realpath(self.strategies_path)
+        self._projects_root: str = os.path.realpath(self.projects_path)
         self.session_filter: str = config.get("session_filter", "root_only")
         self.max_recent_outcomes: int = int(config.get("max_recent_outcomes", 5))
 
         # Working directory - resolved once at mount time from session capability
         self._working_dir: str = config.get("working_dir", "")
 
-        # Cache: built once on first provider:request, reused for the session.
-        # Strategies and project context don't change mid-session.
+        # Cache: the fully wrapped <system-reminder> payload, built once on
+        # first provider:request and reused for the session.  Strategies and
+        # project context don't change mid-session.
         self._cached_injection: str | None = None
 
     # -- helpers: safety ------------------------------------------------
 
-    def _is_safe_path(self, path: Path, root: Path) -> bool:
-        """Verify *path* is contained within *root* (prevent traversal)."""
-        try:
-            path.resolve().relative_to(root.resolve())
-            return True
-        except ValueError:
-            return False
+    def _is_safe_path(self, path: str | Path, root: str) -> bool:
+        """Verify *path* is contained within the already-canonical *root*."""
+        real = os.path.realpath(path)
+        return real == root or real.startswith(root.rstrip(os.sep) + os.sep)
 
     def _is_root_session(self) -> bool:
         """Return True when this session is a root session (not a sub-agent)."""
@@ -105,17 +408,61 @@ class ProjectorHook:
 
     # -- helpers: YAML file loading ------------------------------------
 
-    def _read_yaml(self, path: Path) -> dict:
-        """Read a YAML file, returning ``{}`` on any error."""
+    def _read_yaml(self, path: str | Path, skip_inactive: bool = False) -> dict:
+        """Read a YAML file, returning ``{}`` on any error.
+
+        Parsed results are memoized by ``(st_mtime_ns, st_size)`` so unchanged
+        files cost a single ``stat``.  Callers get a shallow copy and may
+        add keys freely.  With *skip_inactive*, strategy files that
+        :func:`_quick_strategy_probe` reports as inactive read as ``{}``
+        without being parsed.
+        """
+        key = os.fspath(path)
         try:
-            if not path.is_file():
-                return {}
-            text = path.read_text(encoding="utf-8")
-            data = yaml.safe_load(text)
-            return data if isinstance(data, dict) else {}
+            st = os.stat(key)
+            hit = _YAML_CACHE.get(key)
+            if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+                return dict(hit[2])
+            with open(key, "rb") as fh:
+                yaml, loader = _get_yaml_loader()
+                if skip_inactive:
+                    raw = fh.read()
+                    if _quick_strategy_probe(raw) is False:
+                        data = {}
+                    else:
+                        data = yaml.load(raw, Loader=loader)
+                else:
+                    data = yaml.load(fh, Loader=loader)
+            if not isinstance(data, dict):
+                data = {}
+        except FileNotFoundError:
+            return {}
         except Exception:
             logger.debug("Failed to read YAML: %s", path, exc_info=True)
             return {}
+        _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+        return dict(data)
+
+    def _read_yaml_many(
+        self, paths: list[str], skip_inactive: bool = False
+    ) -> list[dict]:
+        """Read several YAML files, in order.
+
+        Unchanged cached files are served inline for one ``stat`` each.  Only
+        the files that need reading go to the thread pool, and only when
+        there are enough of them and more than one worker to overlap their
+        I/O (parsing itself holds the GIL).
+        """
+        results: list[dict | None] = [_cached_yaml(p) for p in paths]
+        misses = [p for p, data in zip(paths, results) if data is None]
+        if not misses:
+            return results  # type: ignore[return-value]
+        read = functools.partial(self._read_yaml, skip_inactive=skip_inactive)
+        if len(misses) >= _PARALLEL_READ_MIN and _READ_POOL_WORKERS > 1:
+            loaded = iter(_read_pool().map(read, misses))
+        else:
+            loaded = map(read, misses)
+        return [data if data is not None else next(loaded) for data in results]
 
     # -- strategies ----------------------------------------------------
 
@@ -129,13 +476,23 @@ class ProjectorHook:
             injection: str
         """
         strategies: list[dict] = []
-        if not self.strategies_path.is_dir():
+        try:
+            with os.scandir(self.strategies_path) as it:
+                entries = sorted(
+                    (e for e in it if e.name.endswith(".yaml") and e.is_file()),
+                    key=lambda e: e.name,
+                )
+        except OSError:
             return strategies
 
-        for path in sorted(self.strategies_path.glob("*.yaml")):
-            if not self._is_safe_path(path, self.strategies_path):
-                continue
-            data = self._read_yaml(path)
+        # Direct children can only escape the root through a symlink.
+        paths = [
+            e.path
+            for e in entries
+            if not e.is_symlink()
+            or self._is_safe_path(e.path, self._strategies_root)
+        ]
+        for data in self._read_yaml_many(paths, skip_inactive=True):
             if data.get("active") and data.get("injection"):
                 strategies.append(data)
 
@@ -143,27 +500,57 @@ class ProjectorHook:
 
     # -- projects ------------------------------------------------------
 
-    def _load_all_projects(self) -> list[dict]:
+    def _load_all_projects(self) -> tuple[list[dict], tuple]:
         """Load every project definition from the projects directory.
 
-        Each project lives in ``projects/<slug>/project.yaml``.
+        Each project lives in ``projects/<slug>/project.yaml``.  Returns
+        ``(projects, stamp)``; *stamp* changes whenever the result may have.
         """
         projects: list[dict] = []
-        if not self.projects_path.is_dir():
-            return projects
-
-        for project_dir in sorted(self.projects_path.iterdir()):
-            if not project_dir.is_dir():
-                continue
-            if not self._is_safe_path(project_dir, self.projects_path):
-                continue
-            data = self._read_yaml(project_dir / "project.yaml")
+        try:
+            with os.scandir(self.projects_path) as it:
+                entries = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+        except OSError:
+            return projects, ()
+
+        entries = [
+            e
+            for e in entries
+            if not e.is_symlink()
+            or self._is_safe_path(e.path, self._projects_root)
+        ]
+        paths = [os.path.join(e.path, "project.yaml") for e in entries]
+        loaded = self._read_yaml_many(paths)
+        for entry, data in zip(entries, loaded):
             if data:
-                data.setdefault("slug", project_dir.name)
-                data["_dir"] = project_dir
+                data.setdefault("slug", entry.name)
+                data["_dir"] = Path(entry.path)
                 projects.append(data)
 
-        return projects
+        stamp = tuple(
+            (path, bool(data), (_YAML_CACHE.get(path) or (None, None))[:2])
+            for path, data in zip(paths, loaded)
+        )
+        return projects, stamp
+
+    @staticmethod
+    def _index_repos(projects: list[dict]) -> tuple[dict[str, int], dict[str, int]]:
+        """Map each repo entry, and its basename, to the first project listing it.
+
+        Values are positions in *projects*; insertion order follows the
+        projects and their ``repos`` lists.
+        """
+        by_repo: dict[str, int] = {}
+        by_name: dict[str, int] = {}
+        for i, project in enumerate(projects):
+            for repo in project.get("repos", []):
+                if not isinstance(repo, str):
+                    continue
+                by_repo.setdefault(repo, i)
+                repo_name = repo.rstrip("/").split("/")[-1]
+                if repo_name:
+                    by_name.setdefault(repo_name, i)
+        return by_repo, by_name
 
     def _detect_project(self, working_dir: str) -> dict | None:
         """Detect which project the session belongs to.
@@ -175,32 +562,40 @@ class ProjectorHook:
         if not working_dir:
             return None
         resolved = Path(working_dir).resolve()
-        projects = self._load_all_projects()
+        projects, stamp = self._load_all_projects()
+        root_key = str(self.projects_path)
+        index = _REPO_INDEX.get(root_key)
+        if index is None or index[0] != stamp:
+            index = (stamp, *self._index_repos(projects), {})
+            _REPO_INDEX[root_key] = index
+        _, by_repo, by_name, matches = index
+
+        remote_url = _git_remote_url(resolved)
+        resolved_str = str(resolved)
+        match_key = (remote_url, resolved_str)
+        if match_key not in matches:
+            matches[match_key] = self._match_repos(by_repo, by_name, remote_url, resolved_str)
+        pos = matches[match_key]
+        return projects[pos] if pos is not None else None
 
+    @staticmethod
+    def _match_repos(
+        by_repo: dict[str, int],
+        by_name: dict[str, int],
+        remote_url: str | None,
+        resolved_str: str,
+    ) -> int | None:
+        """Return the position of the first project matching remote or path."""
         # --- try git remote first ---
-        try:
-            result = subprocess.run(
-                ["git", "-C", str(resolved), "remote", "get-url", "origin"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                remote_url = result.stdout.strip()
-                for project in projects:
-                    for repo in project.get("repos", []):
-                        if repo in remote_url:
-                            return project
-        except Exception:
-            pass
+        if remote_url:
+            for repo, pos in by_repo.items():
+                if repo in remote_url:
+                    return pos
 
         # --- fall back to path matching ---
-        resolved_str = str(resolved)
-        for project in projects:
-            for repo in project.get("repos", []):
-                repo_name = repo.rstrip("/").split("/")[-1]
-                if repo_name and repo_name in resolved_str:
-                    return project
+        for repo_name, pos in by_name.items():
+            if repo_name in resolved_str:
+                return pos
 
         return None
 
@@ -209,29 +604,39 @@ class ProjectorHook:
         outcomes_file = project_dir / "outcomes.jsonl"
         if not outcomes_file.is_file():
             return []
-        if not self._is_safe_path(outcomes_file, self.projects_path):
+        if not self._is_safe_path(outcomes_file, self._projects_root):
             return []
 
-        entries: list[dict] = []
+        limit = self.max_recent_outcomes
+        entries: deque[dict] = deque(maxlen=limit if limit > 0 else None)
         try:
-            for line in outcomes_file.read_text(encoding="utf-8").splitlines():
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    entries.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
+            with outcomes_file.open("rb") as fh:
+                size = fh.seek(0, os.SEEK_END)
+                window = _OUTCOME_TAIL_BYTES
+                while True:
+                    start = max(0, size - window) if limit > 0 else 0
+                    fh.seek(start)
+                    if start:
+                        fh.readline()  # discard the partial first line
+                    entries.clear()
+                    for line in fh:
+                        try:
+                            entries.append(_json_loads(line))
+                        except ValueError:
+                            continue
+                    if start == 0 or len(entries) >= limit:
+                        break
+                    window *= 2
         except Exception:
             logger.debug("Failed reading outcomes: %s", outcomes_file, exc_info=True)
             return []
 
-        return entries[-self.max_recent_outcomes :]
+        return list(entries)
 
     def _load_active_tasks(self, project_dir: Path) -> list[dict]:
         """Return active tasks for a project from ``tasks.yaml``."""
         tasks_file = project_dir / "tasks.yaml"
-        if not self._is_safe_path(tasks_file, self.projects_path):
+        if not self._is_safe_path(tasks_file, self._projects_root):
             return []
         data = self._read_yaml(tasks_file)
         tasks = data.get("tasks", [])
@@ -239,69 +644,150 @@ class ProjectorHook:
             return []
         return [t for t in tasks if isinstance(t, dict) and t.get("status") != "done"]
 
+    @staticmethod
+    def _list_project_files(project_dir: Path) -> set[str]:
+        """Return the names of the entries in *project_dir* (empty on error)."""
+        try:
+            with os.scandir(project_dir) as it:
+                return {e.name for e in it}
+        except OSError:
+            return set()
+
     # -- context building -----------------------------------------------
 
-    def _build_context(self) -> str:
-        """Assemble the full injection text from strategies + project state."""
+    def _build_context(self) -> tuple[str, Path | None]:
+        """Assemble the full injection text from strategies + project state.
+
+        Returns ``(text, project_dir)``; *project_dir* is None when no project
+        was detected.
+        """
         sections: list[str] = []
 
         # --- active strategies ---
         strategies = self._load_active_strategies()
         if strategies:
-            lines = ["## Active Strategies", ""]
-            for strat in strategies:
-                name = strat.get("name", "Unnamed")
-                text = strat["injection"].strip()
-                lines.append(f"### {name}")
-                lines.append(text)
-                lines.append("")
-            sections.append("\n".join(lines))
+            sections.append(
+                "## Active Strategies\n\n"
+                + "\n".join(
+                    f"### {strat.get('name', 'Unnamed')}\n{strat['injection'].strip()}\n"
+                    for strat in strategies
+                )
+            )
 
         # --- project context (using working_dir from session capability) ---
         project = self._detect_project(self._working_dir)
+        project_dir: Path | None = None
 
         if project:
-            project_dir: Path = project["_dir"]
+            project_dir = project["_dir"]
             name = project.get("name", project.get("slug", "unknown"))
 
-            proj_lines = [f"## Current Project: {name}", ""]
+            proj_parts = [f"## Current Project: {name}\n"]
 
             description = project.get("description", "")
             if description:
-                proj_lines.append(description.strip())
-                proj_lines.append("")
+                proj_parts.append(f"{description.strip()}\n")
 
             notes = project.get("notes", "")
             if notes:
-                proj_lines.append(f"**Notes:** {notes.strip()}")
-                proj_lines.append("")
+                proj_parts.append(f"**Notes:** {notes.strip()}\n")
+
+            sections.append("\n".join(proj_parts))
 
-            sections.append("\n".join(proj_lines))
+            # One directory listing tells us which optional files exist, so
+            # projects without outcomes or tasks cost no further probes.
+            present = self._list_project_files(project_dir)
 
             # --- recent outcomes ---
-            outcomes = self._load_recent_outcomes(project_dir)
+            outcomes = (
+                self._load_recent_outcomes(project_dir)
+                if "outcomes.jsonl" in present
+                else []
+            )
             if outcomes:
-                out_lines = ["## Recent Session Outcomes", ""]
-                for entry in outcomes:
-                    ts = entry.get("timestamp", "?")
-                    summary = entry.get("summary", "(no summary)")
-                    out_lines.append(f"- **{ts}**: {summary}")
-                out_lines.append("")
-                sections.append("\n".join(out_lines))
+                sections.append(
+                    "## Recent Session Outcomes\n\n"
+                    + "".join(
+                        f"- **{entry.get('timestamp', '?')}**: "
+                        f"{entry.get('summary', '(no summary)')}\n"
+                        for entry in outcomes
+                    )
+                )
 
             # --- active tasks ---
-            tasks = self._load_active_tasks(project_dir)
+            tasks = (
+                self._load_active_tasks(project_dir) if "tasks.yaml" in present else []
+            )
             if tasks:
-                task_lines = ["## Active Tasks", ""]
-                for task in tasks:
-                    title = task.get("title", task.get("name", "(untitled)"))
-                    status = task.get("status", "")
-                    suffix = f" [{status}]" if status else ""
-                    task_lines.append(f"- {title}{suffix}")
-                task_lines.append("")
-                sections.append("\n".join(task_lines))
+                sections.append("## Active Tasks\n\n" + "".join(map(_render_task, tasks)))
+
+        return "\n".join(sections).strip(), project_dir
+
+    @staticmethod
+    def _project_stamps(project_dir: Path | None) -> tuple:
+        """Return ``(st_mtime_ns, st_size)`` per project state file (None if absent)."""
+        if project_dir is None:
+            return ()
+        stamps = []
+        for name in _PROJECT_STATE_FILES:
+            try:
+                st = os.stat(project_dir / name)
+            except OSError:
+                stamps.append(None)
+            else:
+                stamps.append((st.st_mtime_ns, st.st_size))
+        return tuple(stamps)
+
+    def _dir_mtimes(self) -> tuple[int, int]:
+        """Return ``st_mtime_ns`` of the strategies and projects roots (-1 if absent)."""
+        mtimes = []
+        for root in (self.strategies_path, self.projects_path):
+            try:
+                mtimes.append(os.stat(root).st_mtime_ns)
+            except OSError:
+                mtimes.append(-1)
+        return mtimes[0], mtimes[1]
 
-        return "\n".join(sections).strip()
+    def _get_injection(self) -> str:
+        """Return the wrapped injection payload ("" if there is nothing to inject).
+
+        Reuses a fresh process-level build when one exists.
+        """
+        key = (
+            str(self.strategies_path),
+            str(self.projects_path),
+            self._working_dir,
+            self.max_recent_outcomes,
+        )
+        mtimes = self._dir_mtimes()
+        now = time.monotonic()
+        hit = _INJECTION_CACHE.get(key)
+        if (
+            hit is not None
+            and now - hit[0] < _INJECTION_TTL
+            and hit[1] == mtimes
+            and self._project_stamps(hit[2]) == hit[3]
+        ):
+            return hit[4]
+
+        try:
+            context, project_dir = self._build_context()
+        except Exception:
+            logger.warning("Projector hook: context build failed", exc_info=True)
+            context, project_dir = "", None
+        payload = (
+            f'<system-reminder source="hooks-projector">\n{context}\n</system-reminder>'
+            if context
+            else ""
+        )
+        _INJECTION_CACHE[key] = (
+            now,
+            mtimes,
+            project_dir,
+            self._project_stamps(project_dir),
+            payload,
+        )
+        return payload
 
     # -- event handlers -------------------------------------------------
 
@@ -317,25 +803,14 @@ class ProjectorHook:
 
         # Build once, cache for the session
         if self._cached_injection is None:
-            try:
-                context = self._build_context()
-            except Exception:
-                logger.warning("Projector hook: context build failed", exc_info=True)
-                context = ""
-            self._cached_injection = context
+            self._cached_injection = self._get_injection()
 
         if not self._cached_injection:
             return HookResult(action="continue")
 
-        injection = (
-            '<system-reminder source="hooks-projector">\n'
-            f"{self._cached_injection}\n"
-            "</system-reminder>"
-        )
-
         return HookResult(
             action="inject_context",
-            context_injection=injection,
+            context_injection=self._cached_injection,
             context_injection_role="user",
             ephemeral=True,
             suppress_output=True,
@@ -507,27 +982,12 @@ class ProjectorHook:
         try:
             # Derive git remote for repos field
             repos = []
-            try:
-                result = subprocess.run(
-                    ["git", "-C", str(resolved), "remote", "get-url", "origin"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                if result.returncode == 0:
-                    url = result.stdout.strip()
-                    # Extract org/repo from git URL
-                    for pattern in [
-                        r"github\.com[:/](.+?)(?:\.git)?$",
-                    ]:
-                        import re
-
-                        match = re.search(pattern, url)
-                        if match:
-                            repos.append(match.group(1))
-                            break
-            except Exception:
-                pass
+            url = _git_remote_url(resolved)
+            if url:
+                # Extract org/repo from git URL
+                match = _GITHUB_REPO_RE.search(url)
+                if match:
+                    repos.append(match.group(1))
 
             project_data = {
                 "name": slug,
@@ -538,6 +998,7 @@ class ProjectorHook:
                 "tags": ["auto-registered"],
             }
 
+            yaml, _ = _get_yaml_loader()
             project_dir.mkdir(parents=True, exist_ok=True)
             project_yaml.write_text(
                 yaml.dump(project_data, default_flow_style=False, sort_keys=False),
@@ -580,7 +1041,7 @@ class ProjectorHook:
             return
 
         project_dir: Path = project["_dir"]
-        if not self._is_safe_path(project_dir, self.projects_path):
+        if not self._is_safe_path(project_dir, self._projects_root):
             return
 
         # Get session_id
@@ -618,10 +1079,13 @@ class ProjectorHook:
         outcomes_file = project_dir / "outcomes.jsonl"
         try:
             outcomes_file.parent.mkdir(parents=True, exist_ok=True)
-            with outcomes_file.open("a", encoding="utf-8") as fh:
-                fh.write(json.dumps(record, separators=(",", ":")) + "\n")
+            _append_line(outcomes_file, _json_dumps(record) + b"\n")
         except Exception:
             logger.debug("Failed to write outcome: %s", outcomes_file, exc_info=True)
+        else:
+            # Appending doesn't touch directory mtimes; drop built injections
+            # so the next session in this process sees the new outcome.
+            _INJECTION_CACHE.clear()
 
     @staticmethod
     def _derive_summary(event_data: dict) -> str:
@@ -0,0 +1,62 @@
+"""Tests for the strategy ``active:`` fast-path probe."""
+
+from __future__ import annotations
+
+import pytest
+import yaml
+
+from amplifier_module_hooks_projector.hook import _quick_strategy_probe
+
+
+def _yaml_active(raw: bytes) -> bool:
+    data = yaml.safe_load(raw)
+    return bool(data.get("active", True))
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        (b"name: s\nactive: false\ninjection: x\n", False),
+        (b"name: s\nactive: no\n", False),
+        (b"name: s\nactive: ~\n", False),
+        (b"name: s\nactive: false  # paused\n", False),
+        (b"name: s\nactive: false\r\ninjection: x\r\n", False),
+        (b"name: s\nactive: true\n", True),
+        (b"name: s\nactive: true # on\n", True),
+    ],
+)
+def test_plain_active_line(raw: bytes, expected: bool) -> None:
+    assert _quick_strategy_probe(raw) is expected
+    assert _yaml_active(raw) is expected
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        # '#' only starts a comment after whitespace: the value is "false#x".
+        b"name: s\nactive: false#x\n",
+        # An indented next line continues the plain scalar: "false and more".
+        b"name: s\nactive: false\n  and more\n",
+        b"name: s\nactive: false\n\n  and more\n",
+    ],
+)
+def test_truthy_scalars_starting_with_false_are_not_skipped(raw: bytes) -> None:
+    assert _yaml_active(raw) is True
+    assert _quick_strategy_probe(raw) is not False
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        b"name: s\ninjection: x\n",  # no active line
+        b"name: s\nactive: false\nactive: true\n",  # duplicate key
+        b"name: s\nactive: 'false'\n",  # quoted
+        b"name: s\nactive:\n",  # empty value
+        b"name: s\nactive: &a false\n",  # anchor
+        b"---\nname: s\nactive: false\n",  # document marker
+        b"name: s\nactive: false x\n",
+        b"name: s\nactive: false\n\tand more\n",  # invalid; let the loader say so
+    ],
+)
+def test_unhandled_layouts_fall_back_to_parsing(raw: bytes) -> None:
+    assert _quick_strategy_probe(raw) is None
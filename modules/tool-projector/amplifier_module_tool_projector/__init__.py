@@ -15,9 +15,12 @@ async def mount(coordinator, config=None):
     Args:
         coordinator: The ModuleCoordinator instance
         config: Optional configuration dict
+
+    Returns:
+        Cleanup coroutine that closes the tool's open outcome logs.
     """
     config = config or {}
     tool = ProjectorTool(config)
     await coordinator.mount("tools", tool, name=tool.name)
 
-    return None
+    return tool.close
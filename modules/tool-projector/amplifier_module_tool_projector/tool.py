@@ -6,25 +6,79 @@ All state is stored as files on disk at ~/.amplifier/projector/.
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import functools
+import inspect
 import json
+import os
 import re
+import stat
+import sys
+import threading
+from collections import Counter, OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, BinaryIO, Callable
 
 import yaml
 
 from amplifier_core import ToolResult
 
+try:  # libyaml-backed codec when available; same semantics as safe_load/safe_dump
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeDumper as _Dumper
+    from yaml import SafeLoader as _Loader
+
+try:  # optional fast JSON codec
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+# Parsed state files keyed by path -> (st_mtime_ns, st_size, data, raw bytes).
+# Handlers mutate what they read, so the cache hands out and stores deep
+# copies.  The raw bytes let _write_yaml skip rewriting unchanged content.
+_FILE_CACHE: dict[str, tuple[int, int, dict[str, Any], bytes]] = {}
+
+# Task fields whose string values repeat across tasks and get interned.
+_INTERNED_TASK_FIELDS = ("status", "priority", "id")
+
+# Directories _write_yaml has already created (or found) in this process.
+_ENSURED_DIRS: set[Path] = set()
+
+# Leading bytes of a tasks.yaml written by _write_tasks (a lone top-level
+# ``tasks:`` block sequence); such files can be appended to item by item.
+_TASKS_HEAD = b"tasks:\n- "
+
+# Cap on outcomes.jsonl handles a ProjectorTool keeps open (LRU-evicted).
+_MAX_OPEN_OUTCOME_LOGS = 32
+
+# get_status reads per-project files on worker threads once there are this
+# many projects, with at most _STATUS_CONCURRENCY reads in flight.
+_STATUS_PARALLEL_MIN = 8
+_STATUS_CONCURRENCY = 16
+
+# Initial window (and read chunk size) for JSONL tail reads.
+_TAIL_WINDOW = 64 * 1024
+
+
+_UTC = timezone.utc
+
 
 def _now_iso() -> str:
     """Return current UTC time as ISO-8601 string."""
-    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+    return datetime.now(_UTC).isoformat(timespec="seconds")
 
 
 def _safe_name(name: str) -> str:
@@ -32,43 +86,279 @@ def _safe_name(name: str) -> str:
 
     Raises ValueError on path-traversal attempts or empty names.
     """
-    if not name or not name.strip():
+    name = name.strip() if name else ""
+    if not name:
         raise ValueError("Name must not be empty")
-    name = name.strip()
     # Reject path traversal
     if ".." in name or "/" in name or "\\" in name:
         raise ValueError(f"Invalid name (path traversal rejected): {name!r}")
     # Slugify: lowercase, replace non-alphanum with hyphens, collapse runs
-    slug = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+    slug = _SLUG_RE.sub("-", name.lower()).strip("-")
     if not slug:
         raise ValueError(f"Name produces empty slug: {name!r}")
     return slug
 
 
 def _read_yaml(path: Path) -> dict[str, Any]:
-    """Read a YAML file, returning an empty dict if it doesn't exist."""
-    if not path.exists():
+    """Read a YAML file, returning an empty dict if it doesn't exist.
+
+    Unchanged files (same mtime and size) are served from ``_FILE_CACHE``.
+    """
+    key = str(path)
+    try:
+        st = path.stat()
+        hit = _FILE_CACHE.get(key)
+        if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+            return copy.deepcopy(hit[2])
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        _FILE_CACHE.pop(key, None)
         return {}
-    text = path.read_text(encoding="utf-8")
-    return yaml.safe_load(text) or {}
+    data = yaml.load(raw, Loader=_Loader) or {}
+    _intern_task_fields(data)
+    _FILE_CACHE[key] = (st.st_mtime_ns, st.st_size, copy.deepcopy(data), raw)
+    return data
 
 
-def _write_yaml(path: Path, data: dict[str, Any]) -> None:
-    """Write data to a YAML file with human-friendly formatting."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        yaml.dump(data, default_flow_style=False, sort_keys=False, allow_unicode=True),
+def _intern_task_fields(data: Any) -> None:
+    """Intern the repeated string fields of a parsed ``tasks.yaml`` in place.
+
+    Statuses and priorities come from a handful of values, so every task (and
+    every cached deep copy) then shares one string object per value.
+    """
+    tasks = data.get("tasks") if isinstance(data, dict) else None
+    if not isinstance(tasks, list):
+        return
+    for t in tasks:
+        if not isinstance(t, dict):
+            continue
+        for k in _INTERNED_TASK_FIELDS:
+            v = t.get(k)
+            if type(v) is str:
+                t[k] = sys.intern(v)
+
+
+def _dump_yaml(data: Any) -> bytes:
+    """Serialize *data* as UTF-8 block-style YAML, preserving key order."""
+    return yaml.dump(
+        data,
+        Dumper=_Dumper,
+        default_flow_style=False,
+        sort_keys=False,
+        allow_unicode=True,
         encoding="utf-8",
     )
 
 
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Replace *path* with *data* via a private temp file + ``os.replace``.
+
+    Each call gets its own temp file next to the real target, so concurrent
+    writers never rename each other's (possibly half-written) data into
+    place.  The temp file is removed if anything fails.  Symlinks are written
+    through; an existing file keeps its permission bits and a new one gets
+    the umask-derived mode a plain ``open`` would give it.
+    """
+    target = os.path.realpath(path)
+    tmp = f"{target}.{os.urandom(6).hex()}.tmp"
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    fd = os.open(tmp, flags, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        try:
+            os.chmod(tmp, stat.S_IMODE(os.stat(target).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _write_yaml(path: Path, data: dict[str, Any]) -> None:
+    """Write data to a YAML file with human-friendly formatting.
+
+    The file is replaced atomically (temp file + ``os.replace``), so readers
+    never see a half-written document.  If the file is unchanged since it was
+    cached and would serialize to the same bytes, nothing is written.
+    """
+    key = str(path)
+    raw = _dump_yaml(data)
+    hit = _FILE_CACHE.get(key)
+    if hit is not None and hit[3] == raw:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            pass
+        else:
+            if hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+                return
+    parent = path.parent
+    if parent not in _ENSURED_DIRS:
+        parent.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(parent)
+    try:
+        _atomic_write(path, raw)
+    except FileNotFoundError:
+        # Directory removed since we created it; recreate and retry once.
+        parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write(path, raw)
+    st = path.stat()
+    _FILE_CACHE[key] = (st.st_mtime_ns, st.st_size, copy.deepcopy(data), raw)
+
+
+def _tail_jsonl(path: Path, n: int) -> list[dict[str, Any]]:
+    """Return the last *n* records of a JSONL file (``[]`` if it doesn't exist).
+
+    Reads a window from the end of the file, doubling it until *n* records are
+    found or the whole file has been read.  Unparseable lines are skipped.
+    """
+    try:
+        f = path.open("rb")
+    except FileNotFoundError:
+        return []
+    with f:
+        size = f.seek(0, os.SEEK_END)
+        window = _TAIL_WINDOW
+        while True:
+            start = max(0, size - window)
+            f.seek(start)
+            buf = f.read()
+            # Split off only the trailing lines that can matter, widening the
+            # split if blank or unparseable lines leave us short.
+            maxsplit = n + 1
+            while True:
+                lines = buf.rsplit(b"\n", maxsplit)
+                whole = len(lines) <= maxsplit
+                if start or not whole:
+                    lines = lines[1:]  # partial first line / unsplit remainder
+                records: list[dict[str, Any]] = []
+                for line in reversed(lines):
+                    if not line.strip():
+                        continue
+                    try:
+                        records.append(_json_loads(line))
+                    except json.JSONDecodeError:
+                        continue
+                    if len(records) == n:
+                        break
+                if len(records) >= n or whole:
+                    break
+                maxsplit *= 4
+            if len(records) >= n or start == 0:
+                records.reverse()
+                return records
+            window *= 2
+
+
+def _count_lines(path: Path, lines: int, offset: int) -> tuple[int, int]:
+    """Extend a line count of *path* from byte *offset* to the end of the file.
+
+    Lines are counted the way ``len(text.strip().splitlines())`` counts
+    them: leading and trailing blank lines are ignored, interior ones are
+    not.  *lines* and *offset* describe the file up to just past its last
+    non-whitespace byte (``0, 0`` to start afresh); the same pair is
+    returned for the whole file.  A pair that doesn't fit the file (e.g. an
+    offset not right after content) is discarded and the file recounted.
+    """
+    with path.open("rb") as f:
+        if offset:
+            f.seek(offset - 1)
+            prev = f.read(1)
+            if not prev or prev.isspace() or not lines:
+                lines = offset = 0
+        f.seek(offset)
+        pending = 0  # newlines since the last non-whitespace byte
+        pos = offset
+        for chunk in iter(lambda: f.read(_TAIL_WINDOW), b""):
+            body = chunk.rstrip()
+            if body:
+                if lines:
+                    lines += pending + body.count(b"\n")
+                else:
+                    lines = body.lstrip().count(b"\n") + 1
+                offset = pos + len(body)
+                pending = chunk.count(b"\n", len(body))
+            else:
+                pending += chunk.count(b"\n")
+            pos += len(chunk)
+    return lines, offset
+
+
+def _outcome_count(path: Path) -> int:
+    """Return the number of outcome lines in an ``outcomes.jsonl`` (0 if absent).
+
+    Blank lines before the first and after the last record don't count.  The
+    ``outcomes.count`` sidecar records ``<lines> <offset>`` for the log up to
+    just past its last non-whitespace byte.  The log is append-only (both
+    this tool and the session hook append to it), so only bytes past that
+    offset are read; a log shorter than the offset is recounted from
+    scratch.  The sidecar is refreshed only when its directory is writable,
+    and a failed refresh never fails the caller.
+    """
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
+        return 0
+    sidecar = path.with_name("outcomes.count")
+    try:
+        lines, offset = map(int, sidecar.read_text(encoding="utf-8").split())
+    except (OSError, ValueError):
+        lines, offset = 0, 0
+    if offset > size or offset < 0:
+        lines, offset = 0, 0
+    if not size:
+        return 0
+
+    counted = _count_lines(path, lines, offset)
+    if counted != (lines, offset) and os.access(path.parent, os.W_OK):
+        try:
+            _atomic_write(sidecar, "{} {}".format(*counted).encode("utf-8"))
+        except OSError:
+            pass  # best effort; the count stands
+    return counted[0]
+
+
+def _json_line(record: dict[str, Any]) -> bytes:
+    """Serialize *record* as one UTF-8 JSONL line (newline included)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                record,
+                default=str,
+                option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib handles them
+    return (json.dumps(record, default=str) + "\n").encode("utf-8")
+
+
 def _ok(result: Any) -> str:
     """Return a success JSON envelope."""
-    return json.dumps({"ok": True, "result": result}, indent=2, default=str)
+    envelope = {"ok": True, "result": result}
+    if orjson is not None:
+        # Datetimes go through default=str, as with json.dumps.
+        try:
+            return orjson.dumps(
+                envelope,
+                default=str,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME,
+            ).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib handles them
+    return json.dumps(envelope, indent=2, default=str)
 
 
 def _err(message: str) -> str:
     """Return an error JSON envelope."""
+    if orjson is not None:
+        return orjson.dumps({"ok": False, "error": message}).decode("utf-8")
     return json.dumps({"ok": False, "error": message})
 
 
@@ -89,15 +379,40 @@ def _project_prefix(project_name: str) -> str:
     return project_name[:3].upper()
 
 
-def _next_task_id(tasks: list[dict[str, Any]], prefix: str) -> str:
-    """Generate the next sequential task ID for a project."""
+@functools.lru_cache(maxsize=128)
+def _task_id_re(prefix: str) -> re.Pattern[str]:
+    """Return the compiled ``<prefix>-<n>`` task ID pattern for *prefix*."""
+    return re.compile(rf"^{re.escape(prefix)}-(\d+)$")
+
+
+def _max_task_number(tasks: list[dict[str, Any]], prefix: str) -> int:
+    """Return the highest ``<prefix>-<n>`` task number in *tasks* (0 if none)."""
     max_num = 0
-    pattern = re.compile(rf"^{re.escape(prefix)}-(\d+)$")
+    pattern = _task_id_re(prefix)
     for t in tasks:
         m = pattern.match(t.get("id", ""))
         if m:
             max_num = max(max_num, int(m.group(1)))
-    return f"{prefix}-{max_num + 1:03d}"
+    return max_num
+
+
+def _read_task_counter(counter: Path, tfile: Path) -> int | None:
+    """Return the number stored in ``tasks.maxid``, or None if missing or stale.
+
+    The counter is only trusted when it is at least as new as ``tasks.yaml``;
+    any later rewrite or hand edit of the task list forces a rescan.
+    """
+    try:
+        if counter.stat().st_mtime_ns < tfile.stat().st_mtime_ns:
+            return None
+        return int(counter.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_task_counter(counter: Path, value: int) -> None:
+    """Atomically store *value* in ``tasks.maxid``."""
+    _atomic_write(counter, str(value).encode("utf-8"))
 
 
 # ---------------------------------------------------------------------------
@@ -121,6 +436,36 @@ OPERATIONS = [
 ]
 
 
+# JSON Schema describing the tool's input (shared by all instances).
+_INPUT_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "required": ["operation"],
+    "properties": {
+        "operation": {
+            "type": "string",
+            "enum": OPERATIONS,
+            "description": "The operation to perform.",
+        },
+        "project": {
+            "type": "string",
+            "description": "Project name (for project-specific operations).",
+        },
+        "strategy": {
+            "type": "string",
+            "description": "Strategy name (for strategy-specific operations).",
+        },
+        "data": {
+            "type": "object",
+            "description": "Payload for create/update/log operations.",
+        },
+        "query": {
+            "type": "string",
+            "description": "Optional query or filter for status/list operations.",
+        },
+    },
+}
+
+
 class ProjectorTool:
     """Amplifier tool for managing projects, strategies, tasks, and outcomes.
 
@@ -137,36 +482,7 @@ class ProjectorTool:
         "tracking, outcome logging, and cross-project status queries."
     )
 
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        """JSON Schema describing the tool's input."""
-        return {
-            "type": "object",
-            "required": ["operation"],
-            "properties": {
-                "operation": {
-                    "type": "string",
-                    "enum": OPERATIONS,
-                    "description": "The operation to perform.",
-                },
-                "project": {
-                    "type": "string",
-                    "description": "Project name (for project-specific operations).",
-                },
-                "strategy": {
-                    "type": "string",
-                    "description": "Strategy name (for strategy-specific operations).",
-                },
-                "data": {
-                    "type": "object",
-                    "description": "Payload for create/update/log operations.",
-                },
-                "query": {
-                    "type": "string",
-                    "description": "Optional query or filter for status/list operations.",
-                },
-            },
-        }
+    input_schema: dict[str, Any] = _INPUT_SCHEMA
 
     # -- Init -------------------------------------------------------------------
 
@@ -174,6 +490,20 @@ class ProjectorTool:
         config = config or {}
         base = config.get("base_path", "~/.amplifier/projector")
         self._base = Path(base).expanduser().resolve()
+        # Bound handlers, resolved once so dispatch is a single dict lookup.
+        self._handlers: dict[str, Callable[[dict[str, Any]], str | Awaitable[str]]] = {
+            op: getattr(self, f"_op_{op}") for op in OPERATIONS
+        }
+        # Unbuffered append handles for outcomes.jsonl, keyed by project name.
+        self._outcome_logs: OrderedDict[str, BinaryIO] = OrderedDict()
+        self._outcome_lock = threading.Lock()
+
+    async def close(self) -> None:
+        """Close cached outcome-log handles (mount returns this as cleanup)."""
+        with self._outcome_lock:
+            while self._outcome_logs:
+                _, f = self._outcome_logs.popitem()
+                f.close()
 
     @property
     def _projects_dir(self) -> Path:
@@ -183,6 +513,50 @@ class ProjectorTool:
     def _strategies_dir(self) -> Path:
         return self._base / "strategies"
 
+    def _project_names(self) -> list[str]:
+        """Sorted names of project directories that contain a ``project.yaml``."""
+        try:
+            with os.scandir(self._projects_dir) as it:
+                names = sorted(e.name for e in it if e.is_dir())
+        except FileNotFoundError:
+            return []
+        root = str(self._projects_dir)
+        return [
+            n for n in names if os.path.isfile(os.path.join(root, n, "project.yaml"))
+        ]
+
+    def _scan_projects(self) -> list[tuple[str, dict[str, os.DirEntry[str]]]]:
+        """List every project directory once: ``(name, {filename: entry})``.
+
+        Sorted by name.  One ``scandir`` per project tells the caller which
+        state files exist without probing each one.
+        """
+        try:
+            with os.scandir(self._projects_dir) as it:
+                dirs = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+        except FileNotFoundError:
+            return []
+        scanned: list[tuple[str, dict[str, os.DirEntry[str]]]] = []
+        for d in dirs:
+            try:
+                with os.scandir(d.path) as it:
+                    scanned.append((d.name, {e.name: e for e in it}))
+            except OSError:
+                continue
+        return scanned
+
+    def _strategy_names(self) -> list[str]:
+        """Sorted strategy names (file stems of ``strategies/*.yaml``)."""
+        try:
+            with os.scandir(self._strategies_dir) as it:
+                return sorted(
+                    e.name[: -len(".yaml")]
+                    for e in it
+                    if e.name.endswith(".yaml") and e.is_file()
+                )
+        except FileNotFoundError:
+            return []
+
     # -- Execute (dispatch) -----------------------------------------------------
 
     async def execute(self, input: dict[str, Any]) -> ToolResult:
@@ -190,15 +564,14 @@ class ProjectorTool:
         op = input.get("operation")
         if not op:
             return ToolResult(success=False, error={"message": "Missing required parameter: operation"})
-        if op not in OPERATIONS:
+        handler = self._handlers.get(op) if isinstance(op, str) else None
+        if handler is None:
             return ToolResult(success=False, error={"message": f"Unknown operation: {op!r}. Valid: {', '.join(OPERATIONS)}"})
 
-        handler = getattr(self, f"_op_{op}", None)
-        if handler is None:  # pragma: no cover
-            return ToolResult(success=False, error={"message": f"Operation {op!r} is not implemented"})
-
         try:
             result = handler(input)
+            if inspect.isawaitable(result):
+                result = await result
             return ToolResult(success=True, output=result)
         except ValueError as exc:
             return ToolResult(success=False, error={"message": str(exc)})
@@ -211,19 +584,13 @@ class ProjectorTool:
 
     def _op_list_projects(self, args: dict[str, Any]) -> str:
         """List all project definitions with status."""
-        if not self._projects_dir.exists():
-            return _ok([])
-
         projects: list[dict[str, Any]] = []
-        for proj_dir in sorted(self._projects_dir.iterdir()):
-            pfile = proj_dir / "project.yaml"
-            if not pfile.exists():
-                continue
-            data = _read_yaml(pfile)
+        for name in self._project_names():
+            data = _read_yaml(self._projects_dir / name / "project.yaml")
             projects.append(
                 {
-                    "name": proj_dir.name,
-                    "title": data.get("title", proj_dir.name),
+                    "name": name,
+                    "title": data.get("title", name),
                     "status": data.get("status", "unknown"),
                     "updated": data.get("updated", ""),
                 }
@@ -242,15 +609,7 @@ class ProjectorTool:
         project = _read_yaml(pfile)
 
         # Attach recent outcomes (last 20)
-        outcomes_file = proj_dir / "outcomes.jsonl"
-        recent_outcomes: list[dict[str, Any]] = []
-        if outcomes_file.exists():
-            lines = outcomes_file.read_text(encoding="utf-8").strip().splitlines()
-            for line in lines[-20:]:
-                try:
-                    recent_outcomes.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
+        recent_outcomes = _tail_jsonl(proj_dir / "outcomes.jsonl", 20)
 
         # Attach tasks
         tasks = _read_yaml(proj_dir / "tasks.yaml").get("tasks", [])
@@ -274,6 +633,7 @@ class ProjectorTool:
         if pfile.exists():
             return _err(f"Project already exists: {name}")
 
+        now = _now_iso()
         project = {
             "name": name,
             "title": data.get("title", name),
@@ -281,8 +641,8 @@ class ProjectorTool:
             "description": data.get("description", ""),
             "relationships": data.get("relationships", []),
             "notes": data.get("notes", ""),
-            "created": _now_iso(),
-            "updated": _now_iso(),
+            "created": now,
+            "updated": now,
         }
         # Merge any extra fields from data
         for k, v in data.items():
@@ -321,16 +681,13 @@ class ProjectorTool:
 
     def _op_list_strategies(self, args: dict[str, Any]) -> str:
         """List all strategies with active/inactive status."""
-        if not self._strategies_dir.exists():
-            return _ok([])
-
         strategies: list[dict[str, Any]] = []
-        for sfile in sorted(self._strategies_dir.glob("*.yaml")):
-            data = _read_yaml(sfile)
+        for name in self._strategy_names():
+            data = _read_yaml(self._strategies_dir / f"{name}.yaml")
             strategies.append(
                 {
-                    "name": sfile.stem,
-                    "title": data.get("title", sfile.stem),
+                    "name": name,
+                    "title": data.get("title", name),
                     "active": data.get("active", True),
                     "updated": data.get("updated", ""),
                 }
@@ -358,18 +715,19 @@ class ProjectorTool:
         sfile = self._strategies_dir / f"{name}.yaml"
         existing = _read_yaml(sfile) if sfile.exists() else {}
 
+        now = _now_iso()
         strategy = {
             "name": name,
             "title": data.get("title", existing.get("title", name)),
             "active": data.get("active", existing.get("active", True)),
             "description": data.get("description", existing.get("description", "")),
             "guidelines": data.get("guidelines", existing.get("guidelines", [])),
-            "updated": _now_iso(),
+            "updated": now,
         }
         if not existing:
-            strategy["created"] = _now_iso()
+            strategy["created"] = now
         else:
-            strategy["created"] = existing.get("created", _now_iso())
+            strategy["created"] = existing.get("created", now)
 
         # Merge any extra fields
         for k, v in data.items():
@@ -421,6 +779,38 @@ class ProjectorTool:
         """Write the task list back to disk."""
         _write_yaml(tfile, {"tasks": tasks})
 
+    def _append_task(self, tfile: Path, tasks: list[dict[str, Any]]) -> None:
+        """Persist *tasks* whose only change is a new last item.
+
+        When ``tasks.yaml`` is in the layout ``_write_tasks`` produces, the new
+        item is appended as one more block-sequence entry -- byte-identical
+        to a full rewrite.  Anything else (a new, empty, hand-reshaped or
+        externally modified file) falls back to ``_write_tasks``.
+        """
+        key = str(tfile)
+        hit = _FILE_CACHE.get(key)
+        try:
+            st = tfile.stat()
+        except OSError:
+            self._write_tasks(tfile, tasks)
+            return
+        if (
+            hit is None
+            or (hit[0], hit[1]) != (st.st_mtime_ns, st.st_size)
+            or list(hit[2]) != ["tasks"]
+            or not hit[3].startswith(_TASKS_HEAD)
+            or not hit[3].endswith(b"\n")
+        ):
+            self._write_tasks(tfile, tasks)
+            return
+
+        item = _dump_yaml(tasks[-1:])
+        with tfile.open("ab") as f:
+            f.write(item)
+        st = tfile.stat()
+        data = {"tasks": copy.deepcopy(tasks)}
+        _FILE_CACHE[key] = (st.st_mtime_ns, st.st_size, data, hit[3] + item)
+
     def _op_add_task(self, args: dict[str, Any]) -> str:
         """Add a task to a project."""
         name = _safe_name(args.get("project", ""))
@@ -435,16 +825,22 @@ class ProjectorTool:
 
         tfile, tasks = self._read_tasks(name)
         prefix = _project_prefix(name)
-        task_id = _next_task_id(tasks, prefix)
-
+        counter = tfile.with_name("tasks.maxid")
+        last_num = _read_task_counter(counter, tfile)
+        if last_num is None:
+            last_num = _max_task_number(tasks, prefix)
+        task_num = last_num + 1
+        task_id = f"{prefix}-{task_num:03d}"
+
+        now = _now_iso()
         task: dict[str, Any] = {
             "id": task_id,
             "title": data["title"],
             "status": data.get("status", "todo"),
             "priority": data.get("priority", "normal"),
             "notes": data.get("notes", ""),
-            "created": _now_iso(),
-            "updated": _now_iso(),
+            "created": now,
+            "updated": now,
         }
         # Merge extra fields
         for k, v in data.items():
@@ -452,7 +848,9 @@ class ProjectorTool:
                 task[k] = v
 
         tasks.append(task)
-        self._write_tasks(tfile, tasks)
+        self._append_task(tfile, tasks)
+        # Written after tasks.yaml so the counter is never older than the list.
+        _write_task_counter(counter, task_num)
         return _ok({"added": task})
 
     def _op_update_task(self, args: dict[str, Any]) -> str:
@@ -501,19 +899,12 @@ class ProjectorTool:
             if not pfile.exists():
                 return _err(f"Project not found: {name}")
             _, tasks = self._read_tasks(name)
-            for t in tasks:
-                t["project"] = name
-            all_tasks = tasks
+            all_tasks = [{**t, "project": name} for t in tasks]
         else:
             # All projects
-            if self._projects_dir.exists():
-                for proj_dir in sorted(self._projects_dir.iterdir()):
-                    if not (proj_dir / "project.yaml").exists():
-                        continue
-                    _, tasks = self._read_tasks(proj_dir.name)
-                    for t in tasks:
-                        t["project"] = proj_dir.name
-                    all_tasks.extend(tasks)
+            for proj_name in self._project_names():
+                _, tasks = self._read_tasks(proj_name)
+                all_tasks.extend({**t, "project": proj_name} for t in tasks)
 
         # Filter by status if query looks like a status
         if query:
@@ -550,19 +941,63 @@ class ProjectorTool:
             "details": data.get("details", ""),
         }
 
-        outcomes_file = self._projects_dir / name / "outcomes.jsonl"
-        outcomes_file.parent.mkdir(parents=True, exist_ok=True)
-        with outcomes_file.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(outcome, default=str) + "\n")
-
+        self._append_outcome(name, _json_line(outcome))
         return _ok({"logged": outcome})
 
+    def _append_outcome(self, name: str, line: bytes) -> None:
+        """Append *line* to a project's ``outcomes.jsonl`` on a cached handle.
+
+        Handles are opened unbuffered, so each record is one ``write``.  A
+        handle whose file has since been unlinked is reopened.
+        """
+        with self._outcome_lock:
+            f = self._outcome_logs.get(name)
+            if f is not None and os.fstat(f.fileno()).st_nlink == 0:
+                del self._outcome_logs[name]
+                f.close()
+                f = None
+            if f is None:
+                outcomes_file = self._projects_dir / name / "outcomes.jsonl"
+                f = outcomes_file.open("ab", buffering=0)
+                self._outcome_logs[name] = f
+                if len(self._outcome_logs) > _MAX_OPEN_OUTCOME_LOGS:
+                    _, evicted = self._outcome_logs.popitem(last=False)
+                    evicted.close()
+            else:
+                self._outcome_logs.move_to_end(name)
+            f.write(line)
+
     # ===================================================================
     # STATUS operation
     # ===================================================================
 
-    def _op_get_status(self, args: dict[str, Any]) -> str:
-        """Cross-project status summary: what needs attention, recent activity."""
+    @staticmethod
+    def _read_project_bundle(
+        files: dict[str, os.DirEntry[str]],
+    ) -> tuple[dict[str, Any], list[dict[str, Any]], int, dict[str, Any] | None]:
+        """Read one project's state for get_status.
+
+        Returns (project, tasks, outcome_count, latest_outcome).
+        """
+        project = _read_yaml(Path(files["project.yaml"].path))
+        tasks: list[dict[str, Any]] = []
+        if "tasks.yaml" in files:
+            tasks = _read_yaml(Path(files["tasks.yaml"].path)).get("tasks", [])
+        outcome_count = 0
+        latest_outcome: dict[str, Any] | None = None
+        if "outcomes.jsonl" in files:
+            outcomes_file = Path(files["outcomes.jsonl"].path)
+            outcome_count = _outcome_count(outcomes_file)
+            latest = _tail_jsonl(outcomes_file, 1) if outcome_count else []
+            latest_outcome = latest[0] if latest else None
+        return project, tasks, outcome_count, latest_outcome
+
+    async def _op_get_status(self, args: dict[str, Any]) -> str:
+        """Cross-project status summary: what needs attention, recent activity.
+
+        Side effect: refreshes each project's ``outcomes.count`` sidecar (see
+        :func:`_outcome_count`) where the project directory is writable.
+        """
         status: dict[str, Any] = {
             "timestamp": _now_iso(),
             "projects": [],
@@ -572,94 +1007,84 @@ class ProjectorTool:
         }
 
         # -- Projects ----------------------------------------------------------
-        if self._projects_dir.exists():
-            for proj_dir in sorted(self._projects_dir.iterdir()):
-                pfile = proj_dir / "project.yaml"
-                if not pfile.exists():
-                    continue
-                project = _read_yaml(pfile)
-                name = proj_dir.name
-
-                # Task counts
-                _, tasks = self._read_tasks(name)
-                task_counts: dict[str, int] = {}
-                for t in tasks:
-                    s = t.get("status", "unknown")
-                    task_counts[s] = task_counts.get(s, 0) + 1
-
-                # Recent outcomes count
-                outcomes_file = proj_dir / "outcomes.jsonl"
-                outcome_count = 0
-                latest_outcome: dict[str, Any] | None = None
-                if outcomes_file.exists():
-                    lines = (
-                        outcomes_file.read_text(encoding="utf-8").strip().splitlines()
-                    )
-                    outcome_count = len(lines)
-                    if lines:
-                        try:
-                            latest_outcome = json.loads(lines[-1])
-                        except json.JSONDecodeError:
-                            pass
-
-                proj_summary = {
-                    "name": name,
-                    "title": project.get("title", name),
-                    "status": project.get("status", "unknown"),
-                    "task_counts": task_counts,
-                    "outcome_count": outcome_count,
-                    "updated": project.get("updated", ""),
-                }
-                status["projects"].append(proj_summary)
-
-                # -- Attention signals -----------------------------------------
-                # Stale: no update in project.yaml and no recent outcomes
-                if project.get("status") == "active" and not tasks:
-                    status["attention"].append(
-                        {
-                            "project": name,
-                            "signal": "active_no_tasks",
-                            "message": f"Project '{name}' is active but has no tasks.",
-                        }
-                    )
-
-                blocked = [t for t in tasks if t.get("status") == "blocked"]
-                if blocked:
-                    status["attention"].append(
-                        {
-                            "project": name,
-                            "signal": "blocked_tasks",
-                            "message": (
-                                f"Project '{name}' has {len(blocked)} blocked "
-                                f"task(s): {', '.join(t['id'] for t in blocked)}."
-                            ),
-                        }
-                    )
-
-                if latest_outcome:
-                    status["recent_outcomes"].append(
-                        {
-                            "project": name,
-                            **latest_outcome,
-                        }
-                    )
+        scanned = [(n, f) for n, f in self._scan_projects() if "project.yaml" in f]
+        if len(scanned) < _STATUS_PARALLEL_MIN:
+            bundles = [self._read_project_bundle(files) for _, files in scanned]
+        else:
+            # Each project costs several stat/read round trips; overlap them
+            # (matters on network-mounted home directories).
+            sem = asyncio.Semaphore(_STATUS_CONCURRENCY)
 
-        # -- Strategies --------------------------------------------------------
-        if self._strategies_dir.exists():
-            for sfile in sorted(self._strategies_dir.glob("*.yaml")):
-                data = _read_yaml(sfile)
-                is_active = data.get("active", True)
-                if is_active:
-                    status["strategies"]["active"] += 1
-                else:
-                    status["strategies"]["inactive"] += 1
-                status["strategies"]["list"].append(
+            async def _bounded(files: dict[str, os.DirEntry[str]]):
+                async with sem:
+                    return await asyncio.to_thread(self._read_project_bundle, files)
+
+            bundles = await asyncio.gather(*(_bounded(files) for _, files in scanned))
+
+        for (name, _), (project, tasks, outcome_count, latest_outcome) in zip(scanned, bundles):
+            # Task counts
+            task_counts = dict(Counter(t.get("status", "unknown") for t in tasks))
+
+            proj_summary = {
+                "name": name,
+                "title": project.get("title", name),
+                "status": project.get("status", "unknown"),
+                "task_counts": task_counts,
+                "outcome_count": outcome_count,
+                "updated": project.get("updated", ""),
+            }
+            status["projects"].append(proj_summary)
+
+            # -- Attention signals -----------------------------------------
+            # Stale: no update in project.yaml and no recent outcomes
+            if project.get("status") == "active" and not tasks:
+                status["attention"].append(
                     {
-                        "name": sfile.stem,
-                        "active": is_active,
+                        "project": name,
+                        "signal": "active_no_tasks",
+                        "message": f"Project '{name}' is active but has no tasks.",
                     }
                 )
 
+            # The counts already say whether any task is blocked; only then
+            # walk the tasks again for their ids.
+            n_blocked = task_counts.get("blocked", 0)
+            if n_blocked:
+                blocked_ids = [t["id"] for t in tasks if t.get("status") == "blocked"]
+                status["attention"].append(
+                    {
+                        "project": name,
+                        "signal": "blocked_tasks",
+                        "message": (
+                            f"Project '{name}' has {n_blocked} blocked "
+                            f"task(s): {', '.join(blocked_ids)}."
+                        ),
+                    }
+                )
+
+            if latest_outcome:
+                status["recent_outcomes"].append(
+                    {
+                        "project": name,
+                        **latest_outcome,
+                    }
+                )
+
+        # -- Strategies --------------------------------------------------------
+        for sname in self._strategy_names():
+            data = _read_yaml(self._strategies_dir / f"{sname}.yaml")
+            is_active = data.get("active", True)
+            if is_active:
+                status["strategies"]["active"] += 1
+            else:
+                status["strategies"]["inactive"] += 1
+            status["strategies"]["list"].append(
+                {
+                    "name": sname,
+                    "active": is_active,
+                }
+            )
+
         # Sort recent outcomes by timestamp (newest first)
         status["recent_outcomes"].sort(
             key=lambda o: o.get("timestamp", ""),